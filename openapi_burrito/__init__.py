@@ -1,13 +1,24 @@
 import logging
-from importlib.metadata import PackageNotFoundError, version
+from typing import Any
 
 # Swallow logs unless the user configures a handler
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-# Dynamic versioning
-try:
-    __version__ = version("openapi-burrito")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
-
 __all__ = ["__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolves the dynamic version lazily, on first access of `__version__`."""
+    if name == "__version__":
+        # Deferred: importlib.metadata scans site-packages, which slows CLI startup
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("openapi-burrito")
+        except PackageNotFoundError:
+            value = "0.0.0"
+
+        globals()["__version__"] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
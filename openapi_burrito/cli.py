@@ -3,16 +3,14 @@ from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.panel import Panel
-
-from .generator import generate_sdk
 
 console = Console()
 
 
 def print_security_warning() -> None:
     """Prints a framed security warning before code generation."""
+    from rich.panel import Panel
+
     warning_text = """\
 Code generators can execute malicious payloads from untrusted OpenAPI specs.
 
@@ -45,6 +43,8 @@ app = typer.Typer(
 
 def setup_logging(verbose: bool) -> None:
     """Configures nicely formatted, colorized logging."""
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
 
     # Clean output without timestamps for clarity, unless verbose
@@ -77,10 +77,18 @@ def generate(
     yes: bool = typer.Option(
         False, "--yes", "-y", help="Skip security confirmation prompt"
     ),
+    skip_validation: bool = typer.Option(
+        False,
+        "--skip-validation",
+        help="Skip OpenAPI validation (for specs already validated elsewhere)",
+    ),
 ) -> None:
     """
     [bold]Generate[/bold] a Python client from an OpenAPI specification.
     """
+    # Deferred: jinja2 and prance are only needed once we actually generate
+    from .generator import generate_sdk
+
     setup_logging(verbose)
 
     if not yes:
@@ -94,7 +102,7 @@ def generate(
     typer.echo(f"  - Output: {output_dir}")
 
     try:
-        generate_sdk(spec_source, output_dir)
+        generate_sdk(spec_source, output_dir, validate=not skip_validation)
         console.print(
             f"\n:sparkles: Successfully generated client in {output_dir}",
             style="bold green",
@@ -1,9 +1,12 @@
+import functools
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 from prance import ResolvingParser
 
 from .parser.operation import OperationParser
@@ -14,6 +17,33 @@ logger = logging.getLogger(__name__)
 
 MIN_OPENAPI_VERSION = "3.0.0"
 
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Characters not allowed in a Python package name (after lowercasing)
+_PKG_NAME_RE = re.compile(r"[^a-z0-9-]")
+
+# Leading "major[.minor[.patch]]" of a version string; suffixes are ignored
+_VERSION_RE = re.compile(r"(\d+)(?:\.(\d+))?(?:\.(\d+))?")
+
+
+def _version_tuple(version: str) -> tuple[int, int, int]:
+    """
+    Parses a version string into a (major, minor, patch) tuple for comparison.
+
+    String comparison breaks on multi-digit parts (e.g. "3.10.0" < "3.9.0"),
+    so versions are compared numerically. Unparsable versions map to (0, 0, 0).
+
+    :param version: The version string, e.g. "3.1.0".
+    """
+    match = _VERSION_RE.match(str(version))
+    if not match:
+        return 0, 0, 0
+    major, minor, patch = (int(part or 0) for part in match.groups())
+    return major, minor, patch
+
+
+_MIN_OPENAPI_VERSION_TUPLE = _version_tuple(MIN_OPENAPI_VERSION)
+
 
 def extract_metadata(spec: dict[str, Any]) -> dict[str, str]:
     """
@@ -27,7 +57,7 @@ def extract_metadata(spec: dict[str, Any]) -> dict[str, str]:
     # Convert title to a valid Python package name
     # (alphanumeric and hyphens only, lowercase)
     raw_title = info.get("title", "generated-client")
-    project_name = re.sub(r"[^a-z0-9-]", "", raw_title.lower().replace(" ", "-"))
+    project_name = _PKG_NAME_RE.sub("", raw_title.lower().replace(" ", "-"))
 
     # Sanitize Description (single line, no excessive whitespace)
     # Description should be one-liner without special characters
@@ -44,16 +74,65 @@ def extract_metadata(spec: dict[str, Any]) -> dict[str, str]:
     }
 
 
-def generate_sdk(spec_path: str | Path, output_dir: str | Path) -> None:
+@functools.cache
+def _load_templates() -> tuple[tuple[str, Template], ...]:
+    """
+    Loads and compiles all templates once per process.
+
+    The template set is fixed, so the directory scan and compilation happen on
+    first use only. Bytecode is also persisted to Jinja's per-user cache directory
+    so later processes skip parsing the templates.
+
+    :return: Pairs of (output file name, compiled template).
+    """
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
+    return tuple(
+        (Path(template_name).stem, env.get_template(template_name))
+        for template_name in env.list_templates()
+    )
+
+
+def load_spec(spec_path: str | Path, validate: bool = True) -> dict[str, Any]:
+    """
+    Loads an OpenAPI spec and resolves all $refs.
+
+    :param spec_path: Path or URL to the OpenAPI specification (JSON or YAML).
+    :param validate: Whether to validate the spec with openapi-spec-validator.
+        Skipping validation avoids walking the whole spec a second time, which is
+        useful for large specs that are already validated elsewhere (e.g., in CI).
+    :return: The resolved specification.
+    """
+    if validate:
+        parser = ResolvingParser(spec_path, backend="openapi-spec-validator")
+        return parser.specification  # type: ignore[no-any-return]
+
+    # Same loading and resolution as ResolvingParser, minus the validator run
+    from prance.util.fs import abspath
+    from prance.util.resolver import RefResolver
+    from prance.util.url import absurl, fetch_url
+
+    url = absurl(str(spec_path), abspath(os.getcwd()))
+    resolver = RefResolver(fetch_url(url), url)
+    resolver.resolve_references()
+    return resolver.specs  # type: ignore[no-any-return]
+
+
+def generate_sdk(
+    spec_path: str | Path, output_dir: str | Path, validate: bool = True
+) -> None:
     """
     Generates the Python SDK from the given OpenAPI input source.
 
     :param spec_path: Path or URL to the OpenAPI specification (JSON or YAML).
     :param output_dir: Directory where the generated client will be saved.
+    :param validate: Whether to validate the spec before generating.
     """
     output_dir = Path(output_dir)  # Ensure Path object
-    parser = ResolvingParser(spec_path, backend="openapi-spec-validator")
-    resolved_spec = parser.specification
+    resolved_spec = load_spec(spec_path, validate=validate)
 
     metadata = extract_metadata(resolved_spec)
 
@@ -65,7 +144,7 @@ def generate_sdk(spec_path: str | Path, output_dir: str | Path) -> None:
 
     # Check version compatibility
     openapi_version = resolved_spec.get("openapi", "0.0.0")
-    if openapi_version < MIN_OPENAPI_VERSION:
+    if _version_tuple(openapi_version) < _MIN_OPENAPI_VERSION_TUPLE:
         logger.warning(
             "OpenAPI version %s is below minimum %s, generated code may not work",
             openapi_version,
@@ -78,21 +157,35 @@ def generate_sdk(spec_path: str | Path, output_dir: str | Path) -> None:
     logger.info("Parsed %d models, %d operations", len(models), len(operations))
 
     # Generate client code
-    templates_dir = Path(__file__).parent / "templates"
-    env = Environment(loader=FileSystemLoader(templates_dir))
+    templates = _load_templates()
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
     logger.info("Writing output to %s", output_dir)
 
-    for template_name in env.list_templates():
-        template = env.get_template(template_name)
-        output_name = Path(template_name).stem
-        file_path = output_dir / output_name
+    def render_one(output_name: str, template: Template) -> None:
+        path = output_dir / output_name
+        context = {"metadata": metadata, "models": models, "operations": operations}
+
+        try:
+            existing = path.read_bytes()
+        except FileNotFoundError:
+            # New file: stream chunks straight to disk, nothing to compare against
+            logger.debug("Writing %s", output_name)
+            template.stream(context).dump(str(path), encoding="utf-8")
+            return
+
+        # Regenerating into an existing client: only touch files whose content changed
+        rendered = template.render(context).encode("utf-8")
+        if rendered == existing:
+            logger.debug("Unchanged %s", output_name)
+            return
 
         logger.debug("Writing %s", output_name)
+        path.write_bytes(rendered)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(
-                template.render(metadata=metadata, models=models, operations=operations)
-            )
+    # Templates are independent, so overlap rendering with the file writes
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+        futures = [executor.submit(render_one, *item) for item in templates]
+        for future in futures:
+            future.result()  # Re-raises any error from the worker
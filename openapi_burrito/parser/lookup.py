@@ -1,20 +1,37 @@
 """Schema lookup table for resolving $ref schemas to model names."""
 
-import hashlib
-import json
 import logging
+from collections.abc import Hashable
 from typing import Any
 
-from ..utils import dig
 from .sanitize import sanitize
 
 logger = logging.getLogger(__name__)
 
 
-def _schema_hash(schema: dict[str, Any]) -> str:
-    """Creates a stable MD5 hash of a schema dict for lookup purposes."""
-    serialized = json.dumps(schema, sort_keys=True, default=str)
-    return hashlib.md5(serialized.encode()).hexdigest()
+def _canonical(value: Any) -> Hashable:
+    """
+    Converts a JSON-like value into a hashable canonical form.
+
+    Dicts become key-sorted tuples of (key, value) pairs and lists become tagged
+    tuples, so equal content always yields an equal key. Bools and floats are
+    tagged with their type, since Python treats True == 1 == 1.0 but JSON does not.
+    """
+    if isinstance(value, dict):
+        return tuple((key, _canonical(value[key])) for key in sorted(value))
+    if isinstance(value, list):
+        return ("L", tuple(_canonical(item) for item in value))
+    if isinstance(value, bool | float):
+        return (type(value).__name__, value)
+    if value is None or isinstance(value, str | int):
+        return value
+    # Non-JSON values (e.g. dates from YAML) are compared by their str()
+    return str(value)
+
+
+def _schema_key(schema: dict[str, Any]) -> Hashable:
+    """Creates a content-based key of a schema dict for lookup purposes."""
+    return _canonical(schema)
 
 
 class SchemaLookup:
@@ -22,8 +39,9 @@ class SchemaLookup:
     A lookup table for resolving schema dicts to their model names.
 
     When prance resolves $refs, it creates copies of schema objects.
-    This class uses content hashing to match any copy of a schema
-    back to its original name in components/schemas.
+    This class uses content-based keys to match any copy of a schema
+    back to its original name in components/schemas. Results are memoized
+    by object identity, so repeated lookups of the same dict skip building a key.
     """
 
     def __init__(self, resolved_spec: dict[str, Any]):
@@ -32,11 +50,14 @@ class SchemaLookup:
 
         :param resolved_spec: The OpenAPI spec where $refs have been replaced.
         """
-        schemas = dig(resolved_spec, ("components", "schemas"), default={})
-        self._lookup: dict[str, str] = {
-            _schema_hash(schema): sanitize(name, mode="id")
+        schemas = (resolved_spec.get("components") or {}).get("schemas") or {}
+        self._lookup: dict[Hashable, str] = {
+            _schema_key(schema): sanitize(name, mode="id")
             for name, schema in schemas.items()
         }
+        # id(schema) -> (schema, name); the schema is kept alive so its id
+        # cannot be recycled by another dict while cached
+        self._id_cache: dict[int, tuple[dict[str, Any], str | None]] = {}
         logger.debug("Built schema lookup with %d entries", len(self._lookup))
 
     def get(self, schema: dict[str, Any]) -> str | None:
@@ -46,11 +67,17 @@ class SchemaLookup:
         :param schema: A schema dict (possibly a resolved $ref copy).
         :return: The sanitized model name, or None if not in components/schemas.
         """
-        return self._lookup.get(_schema_hash(schema))
+        key = id(schema)
+        if (hit := self._id_cache.get(key)) is not None:
+            return hit[1]
+
+        name = self._lookup.get(_schema_key(schema))
+        self._id_cache[key] = (schema, name)
+        return name
 
     def __contains__(self, schema: dict[str, Any]) -> bool:
         """Checks if a schema exists in the lookup table."""
-        return _schema_hash(schema) in self._lookup
+        return self.get(schema) is not None
 
     def __len__(self) -> int:
         """Returns the number of schemas in the lookup table."""
@@ -1,5 +1,6 @@
 """Data models for parsed API operations and schemas."""
 
+import sys
 from dataclasses import dataclass
 from typing import Literal
 
@@ -23,39 +24,31 @@ Used for parameters with no default value to enable distinction between:
 """
 
 
-class StatusCode:
+class StatusCode(int):
     """
     A wrapper for HTTP status codes that supports any numeric code.
 
     Unlike HTTPStatus, this works with custom status codes (e.g., 458, 499)
     that some APIs use for application-specific errors.
+    Subclasses int, so hashing, equality, and ordering are plain int operations.
     """
 
-    def __init__(self, code: int):
-        self.value = code
+    __slots__ = ()
 
     @property
     def is_success(self) -> bool:
-        return 200 <= self.value < 300
+        return 200 <= self < 300
 
     @property
     def is_client_error(self) -> bool:
-        return 400 <= self.value < 500
+        return 400 <= self < 500
 
     @property
     def is_server_error(self) -> bool:
-        return 500 <= self.value < 600
+        return 500 <= self < 600
 
-    def __hash__(self) -> int:
-        return hash(self.value)
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, StatusCode):
-            return self.value == other.value
-        return NotImplemented
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedArg:
     """Represents a parsed API argument (path, query, header, cookie, or body)."""
 
@@ -74,8 +67,12 @@ class ParsedArg:
     doc: str = ""
     """Sanitized documentation"""
 
+    def __post_init__(self) -> None:
+        # The same annotations repeat across a spec, so share one string object
+        object.__setattr__(self, "type", sys.intern(self.type))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ParsedResponses:
     """Represents parsed response types for an operation."""
 
@@ -85,7 +82,7 @@ class ParsedResponses:
     """Type annotation for 4xx/5xx responses"""
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedOperation:
     """Represents a fully parsed API operation."""
 
@@ -101,7 +98,7 @@ class ParsedOperation:
     """Operation documentation"""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedProperty:
     """Represents a property in a schema."""
 
@@ -120,8 +117,12 @@ class ParsedProperty:
     default: str | None = None
     """String representation of the default value, if any"""
 
+    def __post_init__(self) -> None:
+        # The same annotations repeat across a spec, so share one string object
+        object.__setattr__(self, "type", sys.intern(self.type))
+
 
-@dataclass
+@dataclass(slots=True)
 class ParsedModel:
     """Represents a parsed schema/model."""
 
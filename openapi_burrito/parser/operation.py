@@ -5,7 +5,7 @@ from dataclasses import replace
 from http import HTTPMethod
 from typing import Any
 
-from ..utils import dig, normalize_path, to_snake_case
+from ..utils import normalize_path, to_snake_case
 from .lookup import SchemaLookup
 from .models import (
     REQUIRED,
@@ -35,9 +35,18 @@ class OperationParser:
     )
     """Valid HTTP methods in OpenAPI spec."""
 
+    http_methods_by_name = {method.value: method for method in valid_http_methods}
+    """Valid HTTP methods keyed by their uppercase name, e.g. "GET"."""
+
     valid_locations = {"path", "query", "header", "cookie"}
     """Valid parameter locations in OpenAPI spec."""
 
+    arg_order = {"path": 0, "body": 1, "query": 2, "header": 3, "cookie": 4}
+    """Sort rank of argument locations (path -> body -> query -> header -> cookie)."""
+
+    type_wrappers = {"query": "Query", "header": "Header", "cookie": "Cookie"}
+    """Type wrappers added to argument types by location, for readability and DevX."""
+
     def __init__(self, resolved_spec: dict[str, Any]) -> None:
         """
         Initializes the OperationParser with a resolved OpenAPI specification.
@@ -59,9 +68,18 @@ class OperationParser:
         :return: A list of dictionaries, each representing an operation
             with its details.
         """
-        operations = []
+        operations: list[ParsedOperation] = []
         paths = self.resolved_spec.get("paths", {})
 
+        # Bind per-operation helpers once, outside the loops
+        get_valid_method = self._get_valid_method
+        parse_parameters = self._parse_parameters
+        parse_request_body = self._parse_request_body
+        build_args = self._build_args
+        parse_responses = self._parse_responses
+        generate_docstring = self._generate_docstring
+        append = operations.append
+
         for path, path_item in paths.items():
             logging.debug("Parsing path %s", path)
 
@@ -69,7 +87,7 @@ class OperationParser:
             path_params = path_item.get("parameters", [])
 
             for method_name, op_data in path_item.items():
-                method = self._get_valid_method(method_name)
+                method = get_valid_method(method_name)
                 if not method:
                     logger.debug(
                         "Skipping invalid HTTP method %s in path %s",
@@ -79,17 +97,17 @@ class OperationParser:
                     continue
 
                 all_raw_params = path_params + op_data.get("parameters", [])
-                params = self._parse_parameters(all_raw_params)
-                body = self._parse_request_body(op_data)
+                params = parse_parameters(all_raw_params)
+                body = parse_request_body(op_data)
 
-                operations.append(
+                append(
                     ParsedOperation(
                         path=normalize_path(sanitize(path, mode="str")),
                         method=method.value,
-                        args=self._build_args(params, body),
-                        responses=self._parse_responses(op_data.get("responses", {})),
+                        args=build_args(params, body),
+                        responses=parse_responses(op_data.get("responses", {})),
                         doc=sanitize(
-                            self._generate_docstring(op_data, path_item), mode="doc"
+                            generate_docstring(op_data, path_item), mode="doc"
                         ),
                     )
                 )
@@ -98,14 +116,9 @@ class OperationParser:
 
     def _get_valid_method(self, method_name: str) -> HTTPMethod | None:
         """Helper to validate and filter HTTP methods."""
-        try:
-            method = HTTPMethod(method_name.upper())
-            if method in self.valid_http_methods:
-                return method
-        except ValueError:
-            pass
-
-        return None
+        # Path items also hold non-method keys (parameters, description, ...),
+        # so use a lookup rather than HTTPMethod(), which raises on those
+        return self.http_methods_by_name.get(method_name.upper())
 
     def _parse_parameters(self, params: list[dict[str, Any]]) -> list[ParsedArg]:
         """Parses path, query, and header parameters of an operation."""
@@ -226,10 +239,9 @@ class OperationParser:
             args.append(body)
 
         # Add type wrappers for readability and DevX
-        wrappers = {"query": "Query", "header": "Header", "cookie": "Cookie"}
         final_args = []
         for arg in args:
-            if wrapper := wrappers.get(arg.in_):
+            if wrapper := self.type_wrappers.get(arg.in_):
                 arg = replace(arg, type=f"{wrapper}[{arg.type}]")
             elif arg.in_ not in ("path", "body"):
                 logger.warning(
@@ -241,8 +253,7 @@ class OperationParser:
             final_args.append(arg)
 
         # Sort params by category (path -> body -> query -> header -> cookie)
-        order = ("path", "body", "query", "header", "cookie")
-        return sorted(final_args, key=lambda p: order.index(p.in_))
+        return sorted(final_args, key=lambda p: self.arg_order[p.in_])
 
     def _parse_responses(self, responses: dict[str, Any]) -> ParsedResponses:
         """
@@ -250,8 +261,8 @@ class OperationParser:
 
         Note: For now we only support 'application/json' and 'application/octet-stream'.
         """
-        # status: (content_type, schema) - schema is None for binary
-        parsed_responses: dict[StatusCode, tuple[str, Any]] = {}
+        # status: (category, content_type, schema) - schema is None for binary
+        parsed_responses: dict[StatusCode, tuple[str, str, Any]] = {}
 
         for code, resp in responses.items():
             # OpenAPI 'default' is ambiguous (could be success or error), skip it
@@ -266,16 +277,25 @@ class OperationParser:
                 logger.warning("Skipping response with invalid status code %s", code)
                 continue
 
+            # Categorize once, so aggregation only compares tags
+            if status.is_success:
+                category = "success"
+            elif status.is_client_error or status.is_server_error:
+                category = "error"
+            else:
+                category = "other"
+
             content = resp.get("content", {})
 
             # Per-response content type priority: JSON > binary > no-content > skip
-            if json_schema := dig(content, ("application/json", "schema")):
-                parsed_responses[status] = ("json", json_schema)
+            json_content = content.get("application/json")
+            if json_content and (json_schema := json_content.get("schema")):
+                parsed_responses[status] = (category, "json", json_schema)
             elif "application/octet-stream" in content:
-                parsed_responses[status] = ("bytes", None)
+                parsed_responses[status] = (category, "bytes", None)
             elif not content:
                 # No content body (e.g., 204, or empty error responses)
-                parsed_responses[status] = ("none", None)
+                parsed_responses[status] = (category, "none", None)
             else:
                 logger.warning(
                     "Response %s has no supported content type, "
@@ -283,42 +303,28 @@ class OperationParser:
                     code,
                 )
 
-        return ParsedResponses(
-            success_type=self._parse_success_type(parsed_responses),
-            error_type=self._parse_error_type(parsed_responses),
-        )
+        success_type, error_type = self._parse_response_types(parsed_responses)
+        return ParsedResponses(success_type=success_type, error_type=error_type)
 
-    def _parse_success_type(
-        self, parsed_responses: dict[StatusCode, tuple[str, Any]]
-    ) -> str:
-        """Aggregates all 2xx response types into a union, defaulting to 'Any'."""
-        success_types = set()
-        for status, (content_type, schema) in parsed_responses.items():
-            if status.is_success:
+    def _parse_response_types(
+        self, parsed_responses: dict[StatusCode, tuple[str, str, Any]]
+    ) -> tuple[str, str]:
+        """
+        Aggregates 2xx and 4xx/5xx response types into unions in a single pass.
+
+        :return: The (success type, error type) pair, each defaulting to 'Any'.
+        """
+        success_types: set[str] = set()
+        error_types: set[str] = set()
+        for status, (category, content_type, schema) in parsed_responses.items():
+            if category == "success":
                 if content_type == "none":
                     success_types.add("None")
                 elif content_type == "bytes":
                     success_types.add("bytes")
                 else:
                     success_types.add(self.type_translator(schema))
-
-        # Clean up success list
-        if "Any" in success_types:
-            success_types.discard("Any")
-            sorted_types = sorted(success_types) + ["Any"]
-        else:
-            sorted_types = sorted(success_types)
-
-        return " | ".join(sorted_types) if sorted_types else "Any"
-
-    def _parse_error_type(
-        self, parsed_responses: dict[StatusCode, tuple[str, Any]]
-    ) -> str:
-        """Aggregates 4xx/5xx response types into a union, defaulting to 'Any'."""
-        error_types = set()
-        for status, (content_type, schema) in parsed_responses.items():
-            is_error = status.is_client_error or status.is_server_error
-            if is_error:
+            elif category == "error":
                 if content_type == "none":
                     error_types.add("None")
                 elif content_type == "json" and schema:
@@ -326,16 +332,20 @@ class OperationParser:
                 else:
                     logger.warning(
                         "Error response %s has unsupported content type %s",
-                        status.value,
+                        status,
                         content_type,
                     )
 
-        # Clean up error list
-        if "Any" in error_types:
-            error_types.discard("Any")
-            sorted_types = sorted(error_types) + ["Any"]
+        return self._join_types(success_types), self._join_types(error_types)
+
+    @staticmethod
+    def _join_types(types: set[str]) -> str:
+        """Joins types into a sorted union with 'Any' last, defaulting to 'Any'."""
+        if "Any" in types:
+            types.discard("Any")
+            sorted_types = sorted(types) + ["Any"]
         else:
-            sorted_types = sorted(error_types)
+            sorted_types = sorted(types)
 
         return " | ".join(sorted_types) if sorted_types else "Any"
 
@@ -346,9 +356,11 @@ class OperationParser:
         summary = op.get("summary", "").strip()
         op_desc = op.get("description", "").strip()
         path_desc = path_item.get("description", "").strip()
-        paragraphs = filter(
-            None, (summary, op_desc, path_desc if path_desc not in op_desc else None)
-        )
-        return "\n\n".join(
-            paragraphs or ["No description provided. See OpenAPI spec for details."]
-        )
+        # Skip the path description if the operation already repeats it
+        if path_desc and path_desc in op_desc:
+            path_desc = ""
+
+        paragraphs = [p for p in (summary, op_desc, path_desc) if p]
+        if not paragraphs:
+            return "No description provided. See OpenAPI spec for details."
+        return "\n\n".join(paragraphs)
@@ -7,25 +7,49 @@ See: CVE-2020-15142, GHSA-9x4c-63pf-525f
 """
 
 import builtins
+import functools
 import keyword
 import re
 from typing import Any, Literal
 
 from .models import StatusCode
 
-# Reserved words that would shadow Python builtins or cause issues
-RESERVED_WORDS = (
-    set(dir(builtins))  # list, dict, str, int, type, id, etc.
-    | {"self", "cls", "true", "false", "null", "undefined"}
-) - {"id"}  # 'id' is commonly used in APIs, allow it
+# Reserved words that are Python keywords, would shadow builtins or cause issues
+RESERVED_WORDS = frozenset(
+    (
+        set(keyword.kwlist)  # if, class, return, etc.
+        | set(dir(builtins))  # list, dict, str, int, type, id, etc.
+        | {"self", "cls", "true", "false", "null", "undefined"}
+    )
+    - {"id"}  # 'id' is commonly used in APIs, allow it
+)
 
 SanitizeType = Literal["id", "str", "doc"]
 
+# Runs of characters not allowed in identifiers, underscores included,
+# so replacing and collapsing happen in one pass
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+# Escapes for string literals, applied in a single pass by str.translate
+_STRING_ESCAPES = str.maketrans(
+    {
+        "\\": "\\\\",
+        '"': '\\"',
+        "'": "\\'",
+        "\n": "\\n",
+        "\r": "\\r",
+        "\t": "\\t",
+    }
+)
+
 
 def sanitize(value: str, mode: SanitizeType = "str") -> str:
     """
     Unified sanitization function for code generation.
 
+    Each mode's helper is memoized, as the same names and strings recur
+    across a spec.
+
     **SECURITY CRITICAL** - Prevents code injection via malicious OpenAPI specs.
 
     See: CVE-2020-15142, GHSA-9x4c-63pf-525f
@@ -39,7 +63,11 @@ def sanitize(value: str, mode: SanitizeType = "str") -> str:
     :raises ValueError: If the value cannot be sanitized into a valid identifier
     """
     if mode == "id":
+        # Not short-circuited: empty identifiers must raise
         return _sanitize_identifier(value)
+    elif not value and mode in ("str", "doc"):
+        # Nothing to escape, e.g. the many fields without a description
+        return ""
     elif mode == "str":
         return _sanitize_string(value)
     elif mode == "doc":
@@ -48,13 +76,11 @@ def sanitize(value: str, mode: SanitizeType = "str") -> str:
         raise ValueError(f"Unknown sanitization mode: {mode}")
 
 
+@functools.lru_cache(maxsize=4096)
 def _sanitize_identifier(value: str) -> str:
     """Converts an arbitrary string into a valid Python identifier."""
-    # Replace non-alphanumeric with underscore
-    sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", value)
-
-    # Collapse multiple underscores
-    sanitized = re.sub(r"_+", "_", sanitized).strip("_")
+    # Replace non-alphanumeric runs with a single underscore
+    sanitized = _NON_ALNUM_RE.sub("_", value).strip("_")
 
     # Handle empty result - should never happen with valid OpenAPI input
     if not sanitized:
@@ -66,11 +92,7 @@ def _sanitize_identifier(value: str) -> str:
     if sanitized[0].isdigit():
         sanitized = f"_{sanitized}"
 
-    # Handle Python keywords (if, class, return, etc.)
-    if keyword.iskeyword(sanitized):
-        sanitized = f"{sanitized}_"
-
-    # Handle builtins (list, dict, str, type, etc.)
+    # Handle Python keywords and builtins (if, class, list, type, etc.)
     if sanitized in RESERVED_WORDS:
         sanitized = f"{sanitized}_"
 
@@ -83,18 +105,13 @@ def _sanitize_identifier(value: str) -> str:
     return sanitized
 
 
+@functools.lru_cache(maxsize=4096)
 def _sanitize_string(value: str) -> str:
     """Escapes a string for safe inclusion in a Python string literal."""
-    return (
-        value.replace("\\", "\\\\")
-        .replace('"', '\\"')
-        .replace("'", "\\'")
-        .replace("\n", "\\n")
-        .replace("\r", "\\r")
-        .replace("\t", "\\t")
-    )
+    return value.translate(_STRING_ESCAPES)
 
 
+@functools.lru_cache(maxsize=4096)
 def _sanitize_docstring(value: str) -> str:
     """Escapes a string for safe inclusion in a triple-quoted docstring."""
     return value.replace('"""', r"\"\"\"").replace("'''", r"\'\'\'")
@@ -12,41 +12,38 @@ from .types import TypeTranslator
 logger = logging.getLogger(__name__)
 
 
-def flatten_schema(schema: dict[str, Any]) -> dict[str, Any]:
+def flatten_schema(schema: dict[str, Any]) -> tuple[dict[str, Any], set[str]]:
     """
-    Recursively merges 'allOf' structures into a single flat properties' dictionary.
+    Merges nested 'allOf' structures into a single flat properties' dictionary.
 
     This handles nested inheritance (e.g., Admin -> User -> BaseModel) by
-    traversing the tree and aggregating all properties and required fields into
-    a single schema representation.
+    traversing the tree and aggregating all properties and required fields.
+    The tree is walked iteratively, accumulating into one dict, so intermediate
+    schemas are never copied.
 
     :param schema: The schema dictionary to flatten.
-    :return: A new dictionary containing the merged properties and required fields.
+    :return: The merged properties and the set of required property names.
     """
     if not schema.get("allOf"):
-        return schema
+        return schema.get("properties", {}), set(schema.get("required", []))
 
     flat_properties: dict[str, Any] = {}
-    flat_required = set()
+    flat_required: set[str] = set()
 
-    # Recursively process each subschema in the inheritance chain
-    for subschema in schema["allOf"]:
-        resolved_sub = flatten_schema(subschema)
-        flat_properties |= resolved_sub.get("properties", {})
-        flat_required |= set(resolved_sub.get("required", []))
+    # Post-order walk: a schema's allOf subschemas are merged (in order) before
+    # its own fields, so own properties override inherited ones at every level
+    stack: list[tuple[dict[str, Any], bool]] = [(schema, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if not expanded and current.get("allOf"):
+            stack.append((current, True))
+            stack.extend((sub, False) for sub in reversed(current["allOf"]))
+            continue
 
-    # Own properties override inherited ones
-    flat_properties |= schema.get("properties", {})
-    flat_required |= set(schema.get("required", []))
+        flat_properties |= current.get("properties", {})
+        flat_required.update(current.get("required", []))
 
-    # Build the flattened schema
-    flattened_schema = schema.copy()
-    flattened_schema["properties"] = flat_properties
-    flattened_schema["required"] = list(flat_required)
-
-    # Remove allOf to prevent downstream double-processing
-    flattened_schema.pop("allOf", None)
-    return flattened_schema
+    return flat_properties, flat_required
 
 
 class SchemaParser:
@@ -79,9 +76,7 @@ class SchemaParser:
             logger.debug("Parsing schema %s", name)
 
             # Deep flatten the schema's inheritance structure (if any)
-            flat = flatten_schema(schema)
-            properties = flat.get("properties", {})
-            required_fields = set(flat.get("required", []))
+            properties, required_fields = flatten_schema(schema)
 
             model_props = [
                 self._parse_property(p_name, p_schema, p_name in required_fields)
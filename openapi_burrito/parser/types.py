@@ -1,7 +1,7 @@
 """Translator module for OpenAPI schemas to Python type hints."""
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from .lookup import SchemaLookup
@@ -10,13 +10,20 @@ from .sanitize import sanitize
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class TypeNode:
-    """Represents a Python type hint as a structured node for manipulation."""
+    """
+    Represents a Python type hint as a structured node for manipulation.
+
+    Nodes are frozen, as translated nodes are cached and shared; use
+    `with_nullable` to get a nullable variant. The rendered string is computed
+    once and cached, since nodes are hashed and compared by it.
+    """
 
     name: str
     args: list["TypeNode"] = field(default_factory=list)
     is_nullable: bool = False
+    _rendered: str | None = field(default=None, init=False, repr=False)
 
     NON_NULLABLE_TYPES = {"Any", "None"}
 
@@ -29,7 +36,21 @@ class TypeNode:
             return NotImplemented
         return self.render() == other.render()
 
+    def with_nullable(self, is_nullable: bool) -> "TypeNode":
+        """Returns this node if nullability matches, otherwise a copy with it set."""
+        if self.is_nullable == is_nullable:
+            return self
+        return replace(self, is_nullable=is_nullable)
+
     def render(self) -> str:
+        rendered = self._rendered
+        if rendered is None:
+            rendered = self._render()
+            # Lazily filled cache, the only field set after construction
+            object.__setattr__(self, "_rendered", rendered)
+        return rendered
+
+    def _render(self) -> str:
         if self.name == "Union":
             rendered_parts = {arg.render() for arg in self.args}
             rendered_parts.discard("None")
@@ -53,6 +74,14 @@ class TypeNode:
         return base
 
 
+# Shared nodes for unconstrained schemas and primitives; never mutated
+_ANY = TypeNode("Any")
+_NEVER = TypeNode("Never")
+_PRIMITIVES = {
+    name: TypeNode(name) for name in ("int", "bool", "float", "None", "str", "bytes")
+}
+
+
 class TypeTranslator:
     """Translates OpenAPI schemas into Python type hint strings."""
 
@@ -71,19 +100,38 @@ class TypeTranslator:
             by schema.
         """
         self.schema_lookup = schema_lookup
+        # id(schema) -> (schema, node); the schema is kept alive so its id
+        # cannot be recycled by another dict while cached
+        self._cache: dict[int, tuple[Any, TypeNode]] = {}
 
     def __call__(self, schema: Any) -> str:
         """Convenience method to get the rendered string directly."""
         return self.translate(schema).render()
 
     def translate(self, schema: Any) -> TypeNode:
-        """The core translation logic. Returns a TypeNode for rich manipulation."""
+        """
+        The core translation logic. Returns a TypeNode for rich manipulation.
+
+        Results are memoized by schema identity, as the same sub-schemas are
+        reached from many models and operations. Returned nodes are shared,
+        so callers must not mutate them.
+        """
         # Boolean schemas (JSON Schema draft 2020-12 / OpenAPI 3.1)
         if schema is True or schema is None or schema == {}:
-            return TypeNode("Any")  # No constraints = any value valid
+            return _ANY  # No constraints = any value valid
         if schema is False:
-            return TypeNode("Never")  # No value valid
+            return _NEVER  # No value valid
+
+        key = id(schema)
+        if (hit := self._cache.get(key)) is not None:
+            return hit[1]
 
+        node = self._translate(schema)
+        self._cache[key] = (schema, node)
+        return node
+
+    def _translate(self, schema: dict[str, Any]) -> TypeNode:
+        """Translates a schema dict without consulting the cache."""
         # Check if schema is a resolved model reference
         if model_name := self.schema_lookup.get(schema):
             return TypeNode(model_name)
@@ -110,15 +158,15 @@ class TypeTranslator:
             else:
                 # Multi-item allOf (intersection) not supported, default to Any
                 # TODO: implement this
-                node = TypeNode("Any")
+                node = _ANY
         elif isinstance(schema_type, list):
             node = self._handle_multi(schema)
         else:
             handler = getattr(self, f"_handle_{schema_type}", self._handle_default)
             node = handler(schema)
 
-        node.is_nullable = schema.get("nullable", False)
-        return node
+        # Copy instead of mutating, as the node may be cached or shared
+        return node.with_nullable(schema.get("nullable", False))
 
     def _handle_enum(self, schema: dict[str, Any]) -> TypeNode:
         literals = [
@@ -137,14 +185,18 @@ class TypeTranslator:
 
         if "oneOf" in schema:
             logger.debug("Handling oneOf schema for polymorphism.")
-            nodes = {self.translate(s) for s in schema["oneOf"]}
-            return TypeNode("Union", args=list(nodes))
+            # Dedupe by rendered string, rendering each candidate once
+            nodes: dict[str, TypeNode] = {}
+            for sub_schema in schema["oneOf"]:
+                node = self.translate(sub_schema)
+                nodes.setdefault(node.render(), node)
+            return TypeNode("Union", args=list(nodes.values()))
         elif "anyOf" in schema:
             logger.warning("anyOf handling is not supported yet, defaulting to Any.")
-            return TypeNode("Any")
+            return _ANY
         else:
             logger.error("Polymorphic schema without oneOf or anyOf keys.")
-            return TypeNode("Any")
+            return _ANY
 
     def _handle_multi(self, schema: dict[str, Any]) -> TypeNode:
         """
@@ -152,23 +204,37 @@ class TypeTranslator:
 
         Resolves each type in the list and combines them into a union.
         """
-        nodes = set()
-
-        # For each type in the list, create a sub-schema and translate it
+        nodes: dict[str, TypeNode] = {}  # Deduped by rendered string
+        types = schema["type"]
+        has_nullable = "nullable" in schema
+        nullable = schema.get("nullable")
+
+        # For each type in the list, translate the schema narrowed to that type.
+        # The schema is narrowed in place instead of copied, so it must bypass
+        # the id-keyed cache and is always restored afterwards.
         # Note: We set nullable=False in children to prevent redundant 'None' hints
         # (e.g., 'str | None | None') when 'null' is already in the type list.
-        for t in schema["type"]:
-            sub_schema = {**schema, "type": t, "nullable": False}
-            nodes.add(self.translate(sub_schema))
+        try:
+            for t in types:
+                schema["type"] = t
+                schema["nullable"] = False
+                node = self._translate(schema)
+                nodes.setdefault(node.render(), node)
+        finally:
+            schema["type"] = types
+            if has_nullable:
+                schema["nullable"] = nullable
+            else:
+                del schema["nullable"]
 
-        return TypeNode("Union", args=list(nodes))
+        return TypeNode("Union", args=list(nodes.values()))
 
     def _handle_array(self, schema: dict[str, Any]) -> TypeNode:
         items = schema.get("items")
         if items:
             return TypeNode("list", args=[self.translate(items)])
         logger.debug("Array schema missing items key, defaulting to list[Any]")
-        return TypeNode("list", args=[TypeNode("Any")])
+        return TypeNode("list", args=[_ANY])
 
     def _handle_object(self, schema: dict[str, Any]) -> TypeNode:
         """
@@ -186,32 +252,28 @@ class TypeTranslator:
             "Inline object schema detected. Defaulting to dict[str, %s]. ",
             value_type.render(),
         )
-        return TypeNode("dict", args=[TypeNode("str"), value_type])
+        return TypeNode("dict", args=[_PRIMITIVES["str"], value_type])
 
     def _handle_string(self, schema: dict[str, Any]) -> TypeNode:
         is_binary = schema.get("format") == "binary"
-        return TypeNode("bytes" if is_binary else "str")
+        return _PRIMITIVES["bytes" if is_binary else "str"]
 
     def _handle_default(self, schema: dict[str, Any]) -> TypeNode:
         schema_type = schema.get("type")
 
-        if isinstance(schema_type, str):
-            primitive_type = self.primitive_type_map.get(schema_type)
-            if primitive_type:
-                return TypeNode(primitive_type)
-
-        # Log and default to Any
         if not isinstance(schema_type, str):
             logger.warning(
                 "Schema type is not a string: %s, defaulting to Any",
                 schema_type,
             )
-        else:
-            logger.warning(
-                "Unknown schema type %s, defaulting to Any",
-                "(supported types: %s)",
-                schema_type,
-                ", ".join(self.primitive_type_map.keys()),
-            )
+            return _ANY
+
+        if (primitive_type := self.primitive_type_map.get(schema_type)) is not None:
+            return _PRIMITIVES[primitive_type]
 
-        return TypeNode("Any")
+        logger.warning(
+            "Unknown schema type %s, defaulting to Any (supported types: %s)",
+            schema_type,
+            ", ".join(self.primitive_type_map.keys()),
+        )
+        return _ANY
@@ -1,16 +1,23 @@
-import json
+import gzip
+import hashlib
+import importlib.util
 import sys
+from collections.abc import Callable, Iterator
 from typing import Any
 
 import typer
-from starlette.responses import HTMLResponse
 
+# Only imported when the preview command runs (see cli.py), so the heavy
+# server dependencies never slow down the other commands
 try:
     import httpx
     import uvicorn
     import yaml
     from fastapi import FastAPI
     from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+    from fastapi.responses import JSONResponse, ORJSONResponse
+    from starlette.requests import Request
+    from starlette.responses import HTMLResponse, Response
 
 except ImportError:
     typer.secho("\n❌ Preview dependencies missing!", fg=typer.colors.RED, bold=True)
@@ -30,6 +37,105 @@ except ImportError:
 
     raise typer.Exit(code=1)
 
+# Optional faster JSON codec; both variants work on bytes, so call sites are the same
+json_loads: Callable[[bytes], Any]
+json_dumps: Callable[[Any], bytes]
+default_response_class: type[JSONResponse]
+try:
+    import orjson
+except ImportError:
+    import json
+
+    json_loads = json.loads
+    default_response_class = JSONResponse
+
+    def json_dumps(obj: Any) -> bytes:
+        # YAML specs may contain dates, which stdlib json can't encode on its own
+        return json.dumps(obj, default=str).encode()
+
+else:
+    json_loads = orjson.loads
+    default_response_class = ORJSONResponse
+
+    def json_dumps(obj: Any) -> bytes:
+        # YAML specs may contain non-string keys (e.g. unquoted status codes)
+        data: bytes = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return data
+
+
+# HTTP/2 for remote specs needs the optional h2 package (httpx[http2])
+_HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Read size for local spec files, which are parsed as they are read
+_FILE_CHUNK_SIZE = 64 * 1024
+
+# libyaml-backed loader if PyYAML was built with it (the PyPI wheels are)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+
+class _ChunkReader:
+    """Minimal file-like view of a chunked byte stream, for the YAML parser."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Reads up to `size` bytes from the stream (everything if negative).
+
+        :param size: Maximum number of bytes to return.
+        :return: The next bytes of the stream, or b"" once it is exhausted.
+        """
+        if size < 0:
+            data, self._buffer = self._buffer + b"".join(self._chunks), b""
+            return data
+
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def looks_like_json(self) -> bool:
+        """
+        Checks whether the first non-whitespace byte opens a JSON object or array.
+        Only buffers as much of the stream as needed to find that byte.
+        """
+        while not (head := self._buffer.lstrip()):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return False
+            self._buffer += chunk
+        return head[:1] in (b"{", b"[")
+
+
+def _load_spec(chunks: Iterator[bytes]) -> Any:
+    """
+    Parses a JSON or YAML document, detecting the format from its first bytes.
+
+    :param chunks: The raw document, as an iterator of byte chunks.
+    :return: The parsed document.
+    """
+    reader = _ChunkReader(chunks)
+    if reader.looks_like_json():
+        # The JSON decoder needs the whole document in one buffer
+        data = reader.read()
+        try:
+            return json_loads(data)
+        except ValueError:
+            # YAML flow mappings start with "{" too, and YAML is a superset of JSON
+            return yaml.load(data, Loader=YamlLoader)
+
+    # The YAML parser reads incrementally, so feed it chunk by chunk
+    return yaml.load(reader, Loader=YamlLoader)
+
 
 def run_preview(input_source: str, port: int = 8000) -> None:
     """Launch a local server with Swagger UI and Redoc for the given OpenAPI spec.
@@ -37,23 +143,26 @@ def run_preview(input_source: str, port: int = 8000) -> None:
     :param input_source: Path or URL to the OpenAPI specification (JSON or YAML).
     :param port: Port to run the server on (default: 8000).
     """
-    # Load the spec (Local or Remote)
+    # Load the spec (Local or Remote); the format is detected from the content, so
+    # URLs and files without a .json/.yaml suffix work as well
     try:
         if input_source.startswith(("http://", "https://")):
-            spec_data = httpx.get(input_source).json()
-        elif input_source.endswith(".json"):
-            with open(input_source) as f:
-                spec_data = json.load(f)
-        elif input_source.endswith(".yaml"):
-            with open(input_source) as f:
-                spec_data = yaml.safe_load(f)
+            with (
+                httpx.Client(
+                    follow_redirects=True,
+                    timeout=httpx.Timeout(10.0, connect=5.0),
+                    http2=_HAS_HTTP2,
+                ) as client,
+                client.stream("GET", input_source) as response,
+            ):
+                response.raise_for_status()
+                spec_data = _load_spec(response.iter_bytes())
         else:
-            typer.secho(
-                f"\n❌ Unsupported file format for {input_source}. Use .json or .yaml",
-                fg=typer.colors.RED,
-                bold=True,
-            )
-            raise typer.Exit(code=1)
+            with open(input_source, "rb") as f:
+                spec_data = _load_spec(iter(lambda: f.read(_FILE_CHUNK_SIZE), b""))
+
+        if not isinstance(spec_data, dict):
+            raise ValueError("the document is not a JSON/YAML mapping")
     except Exception as e:
         typer.secho(
             f"\n❌ Failed to load spec from {input_source}: {e}",
@@ -64,20 +173,59 @@ def run_preview(input_source: str, port: int = 8000) -> None:
 
     # Disable the default openapi, docs, and redoc so they don't conflict with ours
     app_ui = FastAPI(
-        title="SDK Spec Preview", openapi_url=None, docs_url=None, redoc_url=None
+        title="SDK Spec Preview",
+        openapi_url=None,
+        docs_url=None,
+        redoc_url=None,
+        default_response_class=default_response_class,
     )
 
+    # The spec is static for the lifetime of the server, so serialize it only once
+    spec_bytes = json_dumps(spec_data)
+    # JSON specs compress very well, so keep a gzipped copy for clients that accept it
+    # (mtime=0 keeps the output, and thus its ETag, stable across restarts)
+    spec_gzip = gzip.compress(spec_bytes, compresslevel=6, mtime=0)
+
+    spec_etag = hashlib.sha1(spec_bytes).hexdigest()
+    spec_headers = {
+        "ETag": f'"{spec_etag}"',
+        # Let browsers keep a copy but revalidate it, since the port may be reused
+        # for a different spec later on
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    # Each encoding is a separate representation and needs its own ETag
+    spec_gzip_headers = {**spec_headers, "ETag": f'"{spec_etag}-gzip"'}
+
     @app_ui.get("/openapi.json", include_in_schema=False)
-    async def get_spec() -> Any:
-        return spec_data
+    async def get_spec(request: Request) -> Response:
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            body, headers = spec_gzip, spec_gzip_headers
+            encoding = {"Content-Encoding": "gzip"}
+        else:
+            body, headers = spec_bytes, spec_headers
+            encoding = {}
+
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        return Response(
+            body, media_type="application/json", headers={**headers, **encoding}
+        )
+
+    # The UI pages never change either, so render them once up front
+    swagger_body = get_swagger_ui_html(
+        openapi_url="/openapi.json", title="Swagger UI"
+    ).body
+    redoc_body = get_redoc_html(openapi_url="/openapi.json", title="Redoc").body
+    html_headers = {"Cache-Control": "no-cache"}
 
     @app_ui.get("/docs", include_in_schema=False)
     async def swagger_ui() -> HTMLResponse:
-        return get_swagger_ui_html(openapi_url="/openapi.json", title="Swagger UI")
+        return HTMLResponse(swagger_body, headers=html_headers)
 
     @app_ui.get("/redoc", include_in_schema=False)
     async def redoc_ui() -> HTMLResponse:
-        return get_redoc_html(openapi_url="/openapi.json", title="Redoc")
+        return HTMLResponse(redoc_body, headers=html_headers)
 
     typer.secho("\n🚀 Preview Server Running!", fg=typer.colors.GREEN, bold=True)
     typer.echo("  - Swagger UI: ", nl=False)
@@ -85,7 +233,20 @@ def run_preview(input_source: str, port: int = 8000) -> None:
     typer.echo("  - Redoc:      ", nl=False)
     typer.secho(f"http://127.0.0.1:{port}/redoc", fg=typer.colors.CYAN, underline=True)
 
-    uvicorn.run(app_ui, host="127.0.0.1", port=port, log_level="error")
+    # fastapi[standard] ships uvicorn[standard], so the default "auto" loop and http
+    # settings already pick uvloop and httptools where they are available.
+    # The app has no startup/shutdown hooks and is only ever served locally, so skip
+    # the lifespan protocol and the per-response Server/Date headers
+    uvicorn.run(
+        app_ui,
+        host="127.0.0.1",
+        port=port,
+        log_level="error",
+        access_log=False,
+        lifespan="off",
+        server_header=False,
+        date_header=False,
+    )
 
 
 if __name__ == "__main__":
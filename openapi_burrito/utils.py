@@ -1,7 +1,20 @@
+import functools
 import re
+import string
 from collections.abc import Iterable
 from typing import Any
 
+# Compiled once at import; this runs for every path in a spec
+_PATH_PARAM_RE = re.compile(r"\{([^}]+)\}")
+
+# Sentinel for `dig`, since None may be a legitimate value in the structure
+_MISSING = object()
+
+# ASCII-only on purpose: word boundaries are only detected for A-Z/a-z
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_LOWER_OR_DIGIT = _LOWER | frozenset(string.digits)
+
 
 def dig(data: Any, path: Iterable[Any], default: Any = None) -> Any:
     """
@@ -15,27 +28,58 @@ def dig(data: Any, path: Iterable[Any], default: Any = None) -> Any:
     """
     for key in path:
         try:
-            data = data[key]
+            if isinstance(data, dict):
+                # Missing keys are common here; avoid raising KeyError for them
+                data = data.get(key, _MISSING)
+                if data is _MISSING:
+                    return default
+            else:
+                data = data[key]
         except (KeyError, TypeError, IndexError):
             return default
     return data
 
 
+@functools.lru_cache(maxsize=8192)
 def to_snake_case(name: str) -> str:
     """
     Converts camelCase or PascalCase to snake_case.
     Handles acronyms gracefully (e.g., HTTPResponse -> http_response).
     """
-    # Insert underscore between lower+upper (e.g., camelCase -> camel_Case)
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    # Insert underscore between lower/digit+upper
-    # (e.g., camel_Case -> camel_Case, HTTP -> HTTP)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    # Most names in a spec are already lowercase/snake_case; nothing to split or lower
+    if name.islower():
+        return name
 
+    buf: list[str] = []
+    prev = ""
+    last = len(name) - 1
+    for i, char in enumerate(name):
+        # An uppercase letter starts a new word if it follows a lowercase letter or
+        # digit (camelCase -> camel_case), or if it is the last capital of an acronym
+        # followed by lowercase (HTTPResponse -> http_response)
+        if (
+            i
+            and char in _UPPER
+            and (
+                prev in _LOWER_OR_DIGIT
+                or (prev != "\n" and i < last and name[i + 1] in _LOWER)
+            )
+        ):
+            buf.append("_")
+        buf.append(char)
+        prev = char
+    return "".join(buf).lower()
 
+
+@functools.lru_cache(maxsize=4096)
 def normalize_path(path: str) -> str:
     """
     Converts path parameter names to snake_case.
     e.g., /pet/{petId} -> /pet/{pet_id}
     """
-    return re.sub(r"\{([^}]+)\}", lambda m: "{" + to_snake_case(m.group(1)) + "}", path)
+    return _PATH_PARAM_RE.sub(_snake_case_path_param, path)
+
+
+def _snake_case_path_param(match: re.Match[str]) -> str:
+    """Replacement for `_PATH_PARAM_RE` matches, e.g. {petId} -> {pet_id}."""
+    return "{" + to_snake_case(match.group(1)) + "}"